@@ -5,82 +5,176 @@ A concurrent IPv4 ping sweep tool designed for network discovery.
 
 This module provides functionality to scan a given IPv4 network range
 (in CIDR notation) for active hosts by sending ICMP echo requests (pings).
-It leverages Python's 'subprocess' for executing native ping commands
-and 'concurrent.futures' for efficient, parallel scanning.
+It sends echo requests from a single ICMP socket driven by 'asyncio'
+(on uvloop when installed), falling back to native ping commands
+launched as asyncio subprocesses when ICMP sockets are unavailable.
 """
 
+import asyncio
+import errno
+import functools
 import ipaddress
-import subprocess
+import itertools
+import logging
+import os
+import socket
+import struct
+import sys
 import platform
-import concurrent.futures
-from typing import List, Dict, Union, Optional
+import shutil
+from typing import AsyncIterator, Callable, Iterator, List, Set, Tuple, Optional
 
-def _ping_host(host_ip: str, timeout_seconds: int = 1, count: int = 1) -> Dict[str, Union[str, bool]]:
+try:
+    import uvloop
+except ImportError:  # Optional; the default asyncio event loop is used instead
+    uvloop = None
+
+try:
+    import psutil
+except ImportError:  # Optional; needed to recognise on-link networks for ARP sweeps
+    psutil = None
+
+_logger = logging.getLogger(__name__)
+
+# ICMP message types and the fixed echo request payload
+_ICMP_ECHO_REPLY = 0
+_ICMP_ECHO_REQUEST = 8
+_ICMP_PAYLOAD = b"pingsweep".ljust(56, b"\x00")
+# Drain replies inline every N sends so bursts of requests cannot overflow the receive buffer
+_SEND_BATCH = 32
+# Requested socket buffer sizes; the kernel may cap them (net.core.rmem_max, net.core.wmem_max)
+_RCVBUF_BYTES = 1 << 20
+_SNDBUF_BYTES = 1 << 20
+# A full send buffer is retried with back-off, starting at the first delay and doubling up
+# to the second, until no send has succeeded for _SEND_RETRY_SECONDS. Requests to on-link
+# hosts stay queued (and count against the buffer) for ~3 s while the kernel resolves their
+# MAC address.
+_SEND_RETRY_DELAYS = (0.001, 0.05)
+_SEND_RETRY_SECONDS = 10
+# Send errors meaning the host itself cannot be pinged; any other error aborts the sweep
+_UNREACHABLE_ERRNOS = frozenset((errno.EHOSTUNREACH, errno.ENETUNREACH, errno.EHOSTDOWN,
+                                 errno.EACCES, errno.EPERM))
+# Resolved once; the native ping syntax depends on it
+_SYSTEM = platform.system()
+# fping sweeps a whole range from one process; preferred over one native ping per host
+_FPING = shutil.which("fping")
+# arp-scan sweeps on-link networks with ARP, which hosts answer even when they drop ICMP
+_ARP_SCAN = shutil.which("arp-scan")
+# Large networks are swept in consecutive slices of this many hosts, bounding per-sweep state
+# and staying under fping's limit on generated targets. Each host in a slice gets its own
+# ICMP sequence number, so this must not exceed the 16-bit sequence space.
+_CHUNK_HOSTS = 1 << 16
+# Upper bound on pings in flight when max_in_flight is sized automatically: the kernel's default
+# limit on pending MAC address lookups (net.ipv4.neigh.default.gc_thresh3), beyond which
+# requests to on-link hosts are dropped unsent
+_MAX_AUTO_IN_FLIGHT = 1024
+# Send buffer space taken by each queued echo request (skb overhead included; about 832 bytes
+# on Linux datagram ICMP sockets), used to keep automatic sizing within the send buffer
+_SNDBUF_BYTES_PER_PING = 1024
+# Pause per _SEND_BATCH sends for every 1000 pings in flight, spreading out the opening burst of
+# replies so it does not overflow the receive buffer
+_STAGGER_PER_1000 = 0.0001
+# Concurrent native ping processes when falling back from ICMP sockets
+_MAX_SUBPROCESSES = 64
+
+
+def _ones_complement_sum(data: bytes) -> int:
     """
-    Internal helper function to ping a single host and determine reachability.
+    Computes the folded 16-bit one's-complement sum of data in network byte order (RFC 1071).
+
+    Words are summed in native byte order in one pass over a memoryview and the
+    result is byte-swapped at the end, which RFC 1071 shows is equivalent.
 
     Args:
-        host_ip (str): The IP address of the host to ping.
-        timeout_seconds (int): The maximum time in seconds to wait for a reply.
-        count (int): The number of ICMP echo requests to send.
+        data (bytes): The data to sum.
 
     Returns:
-        Dict[str, Union[str, bool]]: A dictionary containing:
-            - 'ip': The IP address that was pinged.
-            - 'reachable': True if the host replied, False otherwise.
-            - 'error': Optional error message if an exception occurred.
+        int: The 16-bit sum, before complementing.
     """
-    # Determine the correct ping command based on the operating system
-    system = platform.system()
-    command: List[str] = []
+    if len(data) % 2:
+        data = bytes(data) + b"\x00"
+    total = sum(memoryview(data).cast("H"))
+    # Fold twice: the first fold can itself carry into bit 16
+    total = (total & 0xFFFF) + (total >> 16)
+    total = (total & 0xFFFF) + (total >> 16)
+    if sys.byteorder == "little":
+        total = ((total & 0xFF) << 8) | (total >> 8)
+    return total
 
-    if system == "Windows":
-        # -n: number of echo requests, -w: timeout in milliseconds
-        command = ["ping", "-n", str(count), "-w", str(timeout_seconds * 1000), host_ip]
-    elif system in ["Linux", "Darwin"]:  # Darwin is macOS
-        # -c: number of echo requests, -W: timeout in seconds
-        command = ["ping", "-c", str(count), "-W", str(timeout_seconds), host_ip]
-    else:
-        return {'ip': host_ip, 'reachable': False, 'error': f"Unsupported OS: {system}"}
 
+# Sum of the payload and the constant type/code word, so each packet only adds ident and seq
+_ICMP_BASE_SUM = _ones_complement_sum(_ICMP_PAYLOAD) + (_ICMP_ECHO_REQUEST << 8)
+
+
+def _new_echo_request() -> bytearray:
+    """
+    Allocates an ICMP echo request buffer to be filled by _fill_echo_request().
+
+    Returns:
+        bytearray: The packet, with the type, code and payload already set.
+    """
+    return bytearray(struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, 0, 0) + _ICMP_PAYLOAD)
+
+
+def _fill_echo_request(packet: bytearray, ident: int, seq: int) -> None:
+    """
+    Writes the identifier, sequence number and checksum into an echo request in place.
+
+    Args:
+        packet (bytearray): A buffer from _new_echo_request().
+        ident (int): The ICMP identifier.
+        seq (int): The ICMP sequence number.
+    """
+    total = _ICMP_BASE_SUM + ident + seq
+    total = (total & 0xFFFF) + (total >> 16)
+    total = (total & 0xFFFF) + (total >> 16)
+    struct.pack_into("!HHH", packet, 2, ~total & 0xFFFF, ident, seq)
+
+
+def _open_icmp_socket() -> Tuple[socket.socket, bool]:
+    """
+    Opens a non-blocking ICMP socket.
+
+    An unprivileged datagram ICMP socket is preferred (Linux with
+    'net.ipv4.ping_group_range', macOS); a raw socket is used otherwise.
+
+    Returns:
+        Tuple[socket.socket, bool]: The socket and whether it is a raw socket
+        (raw sockets receive every ICMP message on the host). Raw sockets, and
+        datagram sockets on macOS, deliver replies with their IPv4 header.
+
+    Raises:
+        OSError: If neither socket type can be opened, or on Windows, where raw
+                 ICMP sockets need bind() and the default event loop cannot watch them.
+    """
+    if _SYSTEM == "Windows":
+        raise OSError("ICMP sockets are not used on Windows.")
     try:
-        # Execute the ping command
-        # capture_output=True captures stdout and stderr
-        # text=True decodes output as text
-        # check=False prevents subprocess.run from raising CalledProcessError for non-zero exit codes
-        result = subprocess.run(command, capture_output=True, text=True, check=False)
-
-        # Check the return code. 0 typically means success.
-        # On Windows, sometimes ping can return 0 even if no reply, but its stdout is more reliable.
-        # On Linux/macOS, 0 means success.
-        if result.returncode == 0:
-            # Look for common success indicators in stdout.
-            # "reply from" for Windows, "bytes from" for Linux/macOS
-            if "reply from" in result.stdout.lower() or "bytes from" in result.stdout.lower():
-                return {'ip': host_ip, 'reachable': True}
-        
-        # If return code is not 0 or success indicator not found
-        return {'ip': host_ip, 'reachable': False}
-
-    except FileNotFoundError:
-        return {'ip': host_ip, 'reachable': False, 'error': "Ping command not found. Is it in your system's PATH?"}
-    except Exception as e:
-        return {'ip': host_ip, 'reachable': False, 'error': f"An unexpected error occurred: {e}"}
-
-
-def ping_sweep(network_cidr: str, timeout_seconds: int = 1, max_workers: int = 20) -> List[str]:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        is_raw = False
+    except OSError:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+        is_raw = True
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF_BYTES)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SNDBUF_BYTES)
+    sock.setblocking(False)
+    return sock, is_raw
+
+
+def _parse_cidr(network_cidr: str) -> Tuple[int, int]:
     """
-    Performs a concurrent ping sweep on the specified IPv4 network range.
+    Parses an IPv4 network in CIDR notation into its address and prefix length.
+
+    Canonical dotted-quad input with a numeric prefix is parsed arithmetically;
+    anything else (netmask notation, IPv6, malformed input) goes through
+    ipaddress.ip_network() so errors keep its descriptive messages.
 
     Args:
         network_cidr (str): The IPv4 network range in CIDR notation (e.g., "192.168.1.0/24").
-        timeout_seconds (int): The timeout for each ping request in seconds.
-                               Defaults to 1 second.
-        max_workers (int): The maximum number of threads to use for concurrent pings.
-                           Defaults to 20. Adjust based on system resources and network size.
 
     Returns:
-        List[str]: A list of reachable IP addresses within the given network range.
+        Tuple[int, int]: The network address as a 32-bit integer (host bits cleared)
+        and the prefix length.
 
     Raises:
         TypeError: If 'network_cidr' is not a string.
@@ -88,6 +182,28 @@ def ping_sweep(network_cidr: str, timeout_seconds: int = 1, max_workers: int = 2
     """
     if not isinstance(network_cidr, str):
         raise TypeError("Input 'network_cidr' must be a string.")
+    return _parse_cidr_cached(network_cidr)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_cidr_cached(network_cidr: str) -> Tuple[int, int]:
+    """
+    Parses a CIDR string for _parse_cidr(), caching the result.
+
+    Callers that sweep the same networks repeatedly skip parsing and validation
+    entirely; invalid input raises every time since exceptions are not cached.
+    """
+    ip_str, sep, prefix_str = network_cidr.partition("/")
+    try:
+        ip_int = struct.unpack("!I", socket.inet_aton(ip_str))[0]
+        # inet_aton() also accepts shorthand and octal forms that ipaddress rejects
+        if _format_ip(ip_int) == ip_str and (not sep or (prefix_str.isascii() and prefix_str.isdigit())):
+            prefix = int(prefix_str) if sep else 32
+            if prefix <= 32:
+                return ip_int & (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF, prefix
+    except (OSError, ValueError):
+        # inet_aton() raises ValueError for embedded nulls and UnicodeEncodeError for surrogates
+        pass
 
     try:
         network = ipaddress.ip_network(network_cidr, strict=False)
@@ -95,34 +211,611 @@ def ping_sweep(network_cidr: str, timeout_seconds: int = 1, max_workers: int = 2
             raise ValueError("Provided network is not a valid IPv4 network.")
     except ValueError as e:
         raise ValueError(f"Invalid IPv4 network format or CIDR: {e}")
+    return int(network.network_address), network.prefixlen
+
+
+def _host_range(network_int: int, prefix: int) -> range:
+    """
+    Returns the usable host addresses of a network as a range of integers.
+
+    Matches IPv4Network.hosts(): the network and broadcast addresses are excluded,
+    except for /31 and /32 networks where every address is a host.
+
+    Args:
+        network_int (int): The network address as a 32-bit integer.
+        prefix (int): The prefix length.
+
+    Returns:
+        range: The host addresses as 32-bit integers.
+    """
+    last = network_int | (0xFFFFFFFF >> prefix)
+    if prefix >= 31:
+        return range(network_int, last + 1)
+    return range(network_int + 1, last)
 
-    reachable_hosts: List[str] = []
-    print(f"Starting ping sweep on network: {network_cidr} ({network.num_addresses} IPs)...")
 
-    # Use ThreadPoolExecutor for concurrent pinging
-    # Threads are suitable here because pings are I/O-bound operations (waiting for network responses)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Map _ping_host to all host IPs in the network
-        # network.hosts() yields only usable host IPs (excludes network and broadcast)
-        # If you want to include network and broadcast, iterate network.iter_hosts() or network.num_addresses
-        future_to_ip = {executor.submit(_ping_host, str(ip), timeout_seconds): str(ip) for ip in network.hosts()}
+def _host_chunks(network_int: int, prefix: int) -> Iterator[range]:
+    """
+    Splits the usable host addresses of a network into consecutive slices.
+
+    Slices are cut from the host range itself rather than from subnets, so
+    addresses such as x.y.1.0 inside a /16 are still swept.
+
+    Args:
+        network_int (int): The network address as a 32-bit integer.
+        prefix (int): The prefix length.
+
+    Yields:
+        range: Up to _CHUNK_HOSTS host addresses as 32-bit integers, in ascending order.
+    """
+    host_range = _host_range(network_int, prefix)
+    for offset in range(0, len(host_range), _CHUNK_HOSTS):
+        yield host_range[offset:offset + _CHUNK_HOSTS]
+
+
+def _format_ip(ip_int: int) -> str:
+    """Formats a 32-bit integer as a dotted-quad IPv4 address."""
+    return f"{(ip_int >> 24) & 0xFF}.{(ip_int >> 16) & 0xFF}.{(ip_int >> 8) & 0xFF}.{ip_int & 0xFF}"
+
+
+@functools.lru_cache(maxsize=8)
+def _ping_argv_prefix(timeout_seconds: int = 1, count: int = 1) -> Optional[Tuple[str, ...]]:
+    """
+    Builds the native ping command line, minus the target host, for this OS.
+
+    Args:
+        timeout_seconds (int): The maximum time in seconds to wait for a reply.
+        count (int): The number of ICMP echo requests to send.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The command prefix, or None if the OS is unsupported.
+    """
+    if _SYSTEM == "Windows":
+        # -n: number of echo requests, -w: timeout in milliseconds
+        return ("ping", "-n", str(count), "-w", str(timeout_seconds * 1000))
+    if _SYSTEM in ("Linux", "Darwin"):  # Darwin is macOS
+        # -c: number of echo requests, -W: timeout in seconds
+        return ("ping", "-c", str(count), "-W", str(timeout_seconds))
+    return None
+
 
-        for future in concurrent.futures.as_completed(future_to_ip):
-            host_ip = future_to_ip[future]
+async def _ping_host(host_ip: str, timeout_seconds: int = 1, count: int = 1) -> Optional[str]:
+    """
+    Internal helper function to ping a single host with the native ping command.
+
+    Used only when no ICMP socket can be opened. The command is launched with
+    asyncio so waiting on it does not block the event loop.
+
+    Args:
+        host_ip (str): The IP address of the host to ping.
+        timeout_seconds (int): The maximum time in seconds to wait for a reply.
+        count (int): The number of ICMP echo requests to send.
+
+    Returns:
+        Optional[str]: 'host_ip' if the host replied; None if it did not, or if
+        it could not be pinged (unsupported OS, ping missing or hung).
+    """
+    prefix = _ping_argv_prefix(timeout_seconds, count)
+    if prefix is None:
+        return None
+
+    try:
+        # Execute the ping command; only its exit status matters, so discard all output
+        process = await asyncio.create_subprocess_exec(
+            *prefix, host_ip, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            # Don't let a hung ping hold its slot indefinitely
+            await asyncio.wait_for(process.wait(), timeout_seconds * count + 1)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return None
+
+        # ping exits with 0 only when a reply was received on Windows, Linux and macOS
+        return host_ip if process.returncode == 0 else None
+
+    except Exception:
+        # Includes FileNotFoundError when ping is not in the system's PATH
+        return None
+
+
+async def _fping_sweep(host_range: range, timeout_seconds: int = 1) -> AsyncIterator[int]:
+    """
+    Pings every host in the range with a single fping process.
+
+    Reachable hosts are yielded as fping reports them.
+
+    Args:
+        host_range (range): The host addresses to ping as 32-bit integers.
+        timeout_seconds (int): The timeout for each ping request in seconds.
+
+    Yields:
+        int: Each reachable IP address as a 32-bit integer.
+    """
+    # -a: print alive targets, -q: nothing else, -r 0: no retries, -i 1: 1 ms between probes
+    # (the default 10 ms would take ~11 minutes per 65,536-host slice; 1 ms is fping's
+    # minimum without root), -g: generate targets from the range
+    process = await asyncio.create_subprocess_exec(
+        _FPING, "-a", "-q", "-r", "0", "-i", "1", "-t", str(timeout_seconds * 1000),
+        "-g", _format_ip(host_range[0]), _format_ip(host_range[-1]),
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+    )
+    try:
+        async for line in process.stdout:
             try:
-                result = future.result()
-                if result['reachable']:
-                    reachable_hosts.append(result['ip'])
-                    print(f"  [+] {result['ip']} is ONLINE")
-                # else:
-                #     print(f"  [-] {result['ip']} is OFFLINE") # Optional: print offline hosts too
-                # if result.get('error'):
-                #     print(f"  [!] Error pinging {result['ip']}: {result['error']}")
-
-            except Exception as exc:
-                print(f"  [!] {host_ip} generated an exception: {exc}")
-
-    reachable_hosts.sort(key=ipaddress.IPv4Address) # Sort results numerically
+                host_int = struct.unpack("!I", socket.inet_aton(line.strip().decode()))[0]
+            except (OSError, UnicodeDecodeError):
+                continue
+            if host_int in host_range:
+                yield host_int
+        await process.wait()
+    finally:
+        # The consumer stopped early
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+def _local_interface(network_int: int, prefix: int) -> Optional[Tuple[str, int]]:
+    """
+    Finds the interface through which the whole network is directly reachable.
+
+    Requires psutil and arp-scan; returns None when either is not installed.
+
+    Args:
+        network_int (int): The network address as a 32-bit integer.
+        prefix (int): The prefix length.
+
+    Returns:
+        Optional[Tuple[str, int]]: The interface name and its own IPv4 address as a
+        32-bit integer, or None if the network is not on-link (or is loopback).
+    """
+    if psutil is None or _ARP_SCAN is None:
+        return None
+    for name, addresses in psutil.net_if_addrs().items():
+        for address in addresses:
+            if address.family != socket.AF_INET or not address.netmask:
+                continue
+            try:
+                ip_int = struct.unpack("!I", socket.inet_aton(address.address))[0]
+                mask = struct.unpack("!I", socket.inet_aton(address.netmask))[0]
+            except OSError:
+                continue
+            # ARP does not run on loopback
+            if ip_int >> 24 == 127:
+                continue
+            # The target must lie entirely within the interface's subnet
+            if (network_int & mask) == (ip_int & mask) and prefix >= bin(mask).count("1"):
+                return name, ip_int
+    return None
+
+
+async def _arp_sweep(interface: str, own_ip: int, host_range: range,
+                     timeout_seconds: int = 1) -> AsyncIterator[int]:
+    """
+    Sweeps a range of on-link hosts with a single arp-scan process.
+
+    Reachable hosts are yielded as arp-scan reports them, followed by this
+    machine's own address if it is in range (it never answers its own ARP).
+
+    Args:
+        interface (str): The interface the network is attached to.
+        own_ip (int): This machine's address on that interface as a 32-bit integer.
+        host_range (range): The host addresses to probe as 32-bit integers.
+        timeout_seconds (int): The timeout for each ARP request in seconds.
+
+    Yields:
+        int: Each reachable IP address as a 32-bit integer.
+
+    Raises:
+        OSError: If arp-scan fails, typically for lack of privileges.
+    """
+    # -q/-x: address and MAC only, -g: drop duplicate replies, -r 1: no retries
+    process = await asyncio.create_subprocess_exec(
+        _ARP_SCAN, "-q", "-x", "-g", "-r", "1", "-t", str(timeout_seconds * 1000),
+        "-I", interface, f"{_format_ip(host_range[0])}-{_format_ip(host_range[-1])}",
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+    )
+    try:
+        async for line in process.stdout:
+            fields = line.split()
+            if not fields:
+                continue
+            try:
+                host_int = struct.unpack("!I", socket.inet_aton(fields[0].decode()))[0]
+            except (OSError, UnicodeDecodeError):
+                continue
+            if host_int in host_range and host_int != own_ip:
+                yield host_int
+        if await process.wait() != 0:
+            raise OSError(f"arp-scan exited with status {process.returncode}")
+    finally:
+        # The consumer stopped early
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    if own_ip in host_range:
+        yield own_ip
+
+
+async def _iter_reachable(host_range: range, local: Optional[Tuple[str, int]] = None,
+                          timeout_seconds: int = 1,
+                          max_in_flight: Optional[int] = None) -> AsyncIterator[int]:
+    """
+    Pings every host in the range concurrently on the running event loop.
+
+    Reachable hosts are yielded as their replies arrive; closing the generator
+    early stops the sweep.
+
+    On-link hosts are swept with ARP via arp-scan when 'local' is given; if
+    arp-scan fails, the hosts it has not reported are swept as below.
+    Otherwise echo requests are sent from a single ICMP socket and
+    replies are matched to hosts by their ICMP identifier and sequence number.
+    If no ICMP socket can be opened, fping is used when installed, else the
+    native ping command.
+
+    Args:
+        host_range (range): The host addresses to ping as 32-bit integers (non-empty).
+        local (Optional[Tuple[str, int]]): The interface and own address from
+                                           _local_interface() if the hosts are on-link.
+        timeout_seconds (int): The timeout for each ping request in seconds.
+        max_in_flight (Optional[int]): The maximum number of pings awaiting a reply at once,
+                                       or None to size it from the number of hosts.
+
+    Yields:
+        int: Each reachable IP address as a 32-bit integer.
+
+    Raises:
+        OSError: If an echo request cannot be sent for a reason other than the host
+                 being unreachable, or the send buffer stops draining.
+    """
+    # Hosts already reported by arp-scan before it failed; the ICMP sweep skips them
+    found: Set[int] = set()
+    if local is not None:
+        try:
+            arp_hits = _arp_sweep(*local, host_range, timeout_seconds)
+            try:
+                async for host_int in arp_hits:
+                    found.add(host_int)
+                    yield host_int
+            finally:
+                await arp_hits.aclose()
+            return
+        except OSError as e:
+            # arp-scan could not run (e.g. unprivileged) or failed part-way; sweep with ICMP instead
+            if found:
+                _logger.warning("%s after reporting %d host(s); sweeping the rest with ICMP", e, len(found))
+
+    auto_in_flight = max_in_flight is None
+    if auto_in_flight:
+        max_in_flight = _MAX_AUTO_IN_FLIGHT
+    loop = asyncio.get_running_loop()
+    ident = os.getpid() & 0xFFFF
+
+    try:
+        sock, is_raw = _open_icmp_socket()
+    except OSError:
+        # No ICMP socket available (e.g. unprivileged without ping_group_range)
+        sock, is_raw = None, False
+    else:
+        if auto_in_flight:
+            # Requests to on-link hosts wait in the send buffer while their MAC address is
+            # resolved (~3 s for dead hosts), so keep no more in flight than it can hold
+            sndbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+            max_in_flight = min(max_in_flight, max(1, sndbuf // _SNDBUF_BYTES_PER_PING))
+        # Futures of the pings awaiting a reply, indexed by sequence number (the host's
+        # offset in the range) and resolved with True on reply or False on timeout
+        waiters: List[Optional[asyncio.Future]] = [None] * len(host_range)
+        packet = _new_echo_request()
+        # Loop time of the next free send slot
+        next_send = 0.0
+        # Loop time of the last successful send (or the start of the sweep)
+        last_sent = loop.time()
+
+    def _on_reply() -> None:
+        while True:
+            try:
+                data, (addr, _) = sock.recvfrom(2048)
+            except OSError:
+                # Drained (BlockingIOError) or a transient socket error; wait for the next wakeup
+                return
+            # Raw sockets, and datagram sockets on macOS, deliver the IPv4 header as well;
+            # an ICMP message never starts with 0x4_ (no such type), so detect it from the data
+            has_ip_header = data[0] >> 4 == 4
+            offset = (data[0] & 0x0F) * 4 if has_ip_header else 0
+            if len(data) < offset + 8:
+                continue
+            icmp_type, _, _, reply_ident, seq = struct.unpack_from("!BBHHH", data, offset)
+            # Datagram sockets have their identifier rewritten by the kernel
+            if icmp_type != _ICMP_ECHO_REPLY or (is_raw and reply_ident != ident):
+                continue
+            if has_ip_header:
+                # Source address field of the IP header
+                source = struct.unpack_from("!I", data, 12)[0]
+            else:
+                source = struct.unpack("!I", socket.inet_aton(addr))[0]
+            # The sequence number is the host's offset in the range, which also gives its address
+            if seq >= len(waiters) or source != host_range.start + seq:
+                continue
+            future = waiters[seq]
+            if future is not None and not future.done():
+                future.set_result(True)
+
+    def _expire(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(False)
+
+    async def _send(seq: int, host_ip: str) -> None:
+        nonlocal last_sent
+        delay, max_delay = _SEND_RETRY_DELAYS
+        while True:
+            # sendto() copies the buffer, so one packet is reused for every host; it is
+            # refilled on each attempt since other workers send from it in the meantime
+            _fill_echo_request(packet, ident, seq)
+            try:
+                sock.sendto(packet, (host_ip, 0))
+                last_sent = loop.time()
+                return
+            except OSError as e:
+                # The send buffer is full: BlockingIOError from datagram sockets, ENOBUFS from raw ones
+                if not isinstance(e, BlockingIOError) and e.errno != errno.ENOBUFS:
+                    raise
+                # Space frees up as queued requests leave, so only give up once none have
+                if loop.time() - last_sent >= _SEND_RETRY_SECONDS:
+                    raise
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+    async def _icmp_ping(host_int: int, host_ip: str) -> bool:
+        nonlocal next_send
+        # Give each send its own time slot so the workers don't all fire at once
+        now = loop.time()
+        slot = max(next_send, now)
+        next_send = slot + send_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+        # A bare future plus a timer; asyncio.wait_for() would wrap every ping in its own Task
+        seq = host_int - host_range.start
+        future = loop.create_future()
+        waiters[seq] = future
+        timer = None
+        try:
+            await _send(seq, host_ip)
+            if seq % _SEND_BATCH == 0:
+                _on_reply()
+            timer = loop.call_later(timeout_seconds, _expire, future)
+            return await future
+        finally:
+            if timer is not None:
+                timer.cancel()
+            waiters[seq] = None
+
+    async def _ping_one(host_int: int) -> Optional[str]:
+        host_ip = _format_ip(host_int)
+        if sock is None:
+            return await _ping_host(host_ip, timeout_seconds)
+        try:
+            return host_ip if await _icmp_ping(host_int, host_ip) else None
+        except OSError as e:
+            # Unroutable, a broadcast address, or rejected by a firewall rule
+            if e.errno in _UNREACHABLE_ERRNOS:
+                return None
+            raise
+
+    # Shared by all workers, so each address is formatted only when a worker pulls it
+    hosts = (host_int for host_int in host_range if host_int not in found) if found else iter(host_range)
+    # Reachable hosts, followed by None once every worker has finished
+    hits: asyncio.Queue = asyncio.Queue()
+
+    async def _worker() -> None:
+        for host_int in hosts:
+            if await _ping_one(host_int) is not None:
+                hits.put_nowait(host_int)
+
+    async def _run_workers() -> None:
+        try:
+            await asyncio.gather(*(_worker() for _ in range(num_workers)))
+        finally:
+            hits.put_nowait(None)
+
+    if sock is not None:
+        try:
+            loop.add_reader(sock.fileno(), _on_reply)
+        except NotImplementedError:
+            # The event loop cannot watch sockets (e.g. a Proactor loop)
+            sock.close()
+            sock = None
+    if sock is None:
+        # Use fping or the native ping command instead
+        if _FPING is not None:
+            fping_hits = _fping_sweep(host_range, timeout_seconds)
+            try:
+                async for host_int in fping_hits:
+                    if host_int not in found:
+                        yield host_int
+            finally:
+                await fping_hits.aclose()
+            return
+        max_in_flight = min(max_in_flight, _MAX_SUBPROCESSES)
+
+    # No more workers than hosts, so small networks don't pay for idle ones
+    num_workers = max(1, min(max_in_flight, len(host_range)))
+    send_interval = _STAGGER_PER_1000 * num_workers / 1000 / _SEND_BATCH
+    workers = loop.create_task(_run_workers())
+    try:
+        while True:
+            host_int = await hits.get()
+            if host_int is None:
+                break
+            yield host_int
+        # Surface any exception raised by a worker
+        await workers
+    finally:
+        workers.cancel()
+        # Let the cancellation reach every worker before returning
+        await asyncio.wait([workers])
+        if sock is not None:
+            loop.remove_reader(sock.fileno())
+            sock.close()
+
+
+async def _iter_network(network_int: int, prefix: int, timeout_seconds: int = 1,
+                        max_in_flight: Optional[int] = None) -> AsyncIterator[int]:
+    """
+    Sweeps a whole network chunk by chunk, yielding each reachable host as it replies.
+
+    Chunks are swept one after another in address order, so hits from one
+    chunk all arrive before any from the next. Closing the generator closes
+    the sweep of the current chunk straight away.
+
+    Args:
+        network_int (int): The network address as a 32-bit integer.
+        prefix (int): The prefix length.
+        timeout_seconds (int): The timeout for each ping request in seconds.
+        max_in_flight (Optional[int]): The maximum number of pings awaiting a reply at once,
+                                       or None to size it from the number of hosts.
+
+    Yields:
+        int: Each reachable IP address as a 32-bit integer.
+    """
+    local = _local_interface(network_int, prefix)
+    for chunk in _host_chunks(network_int, prefix):
+        # Each sweep is closed explicitly (contextlib.aclosing() needs Python 3.10), so leaving
+        # early stops its pings and subprocesses straight away rather than at garbage collection
+        hits = _iter_reachable(chunk, local, timeout_seconds, max_in_flight)
+        try:
+            async for host_int in hits:
+                yield host_int
+        finally:
+            await hits.aclose()
+
+
+async def _collect_reachable(network_int: int, prefix: int, timeout_seconds: int,
+                             max_in_flight: Optional[int],
+                             on_hit: Optional[Callable[[str], None]] = None) -> List[int]:
+    """
+    Runs a full sweep, reporting each reachable host as it is found.
+
+    Hits are logged at INFO level and passed to 'on_hit'; the address is only
+    formatted when one of them will use it.
+
+    Returns:
+        List[int]: The reachable IP addresses as 32-bit integers, sorted numerically.
+    """
+    reachable_ints: List[int] = []
+    log_hits = _logger.isEnabledFor(logging.INFO)
+    # Chunks are swept in order, so flags are only kept for the chunk currently being swept:
+    # one per host, indexed by offset from its first host
+    chunks = _host_chunks(network_int, prefix)
+    chunk = next(chunks)
+    up = bytearray(len(chunk))
+    hits = _iter_network(network_int, prefix, timeout_seconds, max_in_flight)
+    try:
+        async for host_int in hits:
+            while host_int >= chunk.stop:
+                # Walking the flags in address order yields the hosts already sorted
+                reachable_ints.extend(itertools.compress(chunk, up))
+                chunk = next(chunks)
+                up = bytearray(len(chunk))
+            up[host_int - chunk.start] = 1
+            if log_hits or on_hit is not None:
+                host_ip = _format_ip(host_int)
+                _logger.info("online %s", host_ip)
+                if on_hit is not None:
+                    on_hit(host_ip)
+    finally:
+        await hits.aclose()
+    reachable_ints.extend(itertools.compress(chunk, up))
+    return reachable_ints
+
+
+def _run(coro):
+    """Runs a coroutine to completion on a fresh event loop, using uvloop when installed."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    # uvloop < 0.18 has no run(); drive one of its loops directly
+    loop = uvloop.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def iter_ping_sweep(network_cidr: str, timeout_seconds: int = 1,
+                          max_in_flight: Optional[int] = None) -> AsyncIterator[str]:
+    """
+    Performs a concurrent ping sweep, yielding each reachable host as soon as it replies.
+
+    Must be iterated on a running event loop, e.g.:
+
+        async for ip in iter_ping_sweep("192.168.1.0/24"):
+            print(ip)
+
+    Args:
+        network_cidr (str): The IPv4 network range in CIDR notation (e.g., "192.168.1.0/24").
+        timeout_seconds (int): The timeout for each ping request in seconds.
+                               Defaults to 1 second.
+        max_in_flight (Optional[int]): The maximum number of pings awaiting a reply at once.
+                                       Defaults to None, which sizes it from the network
+                                       (one per host, up to 1024 and what the socket's send
+                                       buffer can hold). Capped lower when falling back to
+                                       the native ping command.
+
+    Yields:
+        str: Each reachable IP address, in the order replies arrive.
+
+    Raises:
+        TypeError: If 'network_cidr' is not a string.
+        ValueError: If 'network_cidr' is not a valid IPv4 network.
+        OSError: If an echo request cannot be sent for a reason other than the host
+                 being unreachable, or the send buffer stops draining.
+    """
+    network_int, prefix = _parse_cidr(network_cidr)
+    hits = _iter_network(network_int, prefix, timeout_seconds, max_in_flight)
+    try:
+        async for host_int in hits:
+            yield _format_ip(host_int)
+    finally:
+        await hits.aclose()
+
+
+def ping_sweep(network_cidr: str, timeout_seconds: int = 1, max_in_flight: Optional[int] = None,
+               on_hit: Optional[Callable[[str], None]] = None) -> List[str]:
+    """
+    Performs a concurrent ping sweep on the specified IPv4 network range.
+
+    Args:
+        network_cidr (str): The IPv4 network range in CIDR notation (e.g., "192.168.1.0/24").
+        timeout_seconds (int): The timeout for each ping request in seconds.
+                               Defaults to 1 second.
+        max_in_flight (Optional[int]): The maximum number of pings awaiting a reply at once.
+                                       Defaults to None, which sizes it from the network
+                                       (one per host, up to 1024 and what the socket's send
+                                       buffer can hold). Capped lower when falling back to
+                                       the native ping command.
+        on_hit (Optional[Callable[[str], None]]): Called with each reachable IP address
+                                                  as soon as it replies. Defaults to None.
+                                                  Hits are also logged at INFO level.
+
+    Returns:
+        List[str]: A list of reachable IP addresses within the given network range.
+
+    Raises:
+        TypeError: If 'network_cidr' is not a string.
+        ValueError: If 'network_cidr' is not a valid IPv4 network.
+        OSError: If an echo request cannot be sent for a reason other than the host
+                 being unreachable, or the send buffer stops draining.
+    """
+    network_int, prefix = _parse_cidr(network_cidr)
+    print(f"Starting ping sweep on network: {network_cidr} ({1 << (32 - prefix)} IPs)...")
+
+    reachable_ints = _run(_collect_reachable(network_int, prefix, timeout_seconds, max_in_flight, on_hit))
+    reachable_hosts = [_format_ip(host_int) for host_int in reachable_ints]
     print(f"\nPing sweep complete. Found {len(reachable_hosts)} reachable host(s).")
     return reachable_hosts
 
@@ -145,13 +838,16 @@ if __name__ == "__main__":
         ("192.168.1/24", False),         # Malformed IP
         ("invalid-network", False),      # Non-IP string
         ("192.168.1.0", False),          # Missing CIDR
+        ("1.2.3.4\x00/24", False),       # Embedded null character
+        ("\udcff/8", False),             # Unencodable surrogate
     ]
 
     for network_str, expect_success in test_networks:
         print(f"\n===== Attempting to sweep: '{network_str}' =====")
         try:
             # Use a slightly longer timeout for robust testing
-            online_hosts = ping_sweep(network_str, timeout_seconds=1, max_workers=20)
+            online_hosts = ping_sweep(network_str, timeout_seconds=1,
+                                      on_hit=lambda ip: print(f"  [+] {ip} is ONLINE"))
             if expect_success:
                 print(f"Successfully swept '{network_str}'. Reachable hosts: {online_hosts}")
             else:
@@ -181,3 +877,21 @@ if __name__ == "__main__":
             print(f"PASS: Correctly raised TypeError for '{invalid_input}': {e}")
         except Exception as e:
             print(f"FAIL: Raised unexpected error for '{invalid_input}': {e}")
+
+    print("\n--- Checksum Tests (against a struct.unpack reference) ---")
+    checksum_inputs = [
+        b"",
+        b"\x01",
+        b"\xff" * 6 + b"\x02\x00",  # First fold carries into bit 16
+        b"\xff" * 64,
+        _ICMP_PAYLOAD,
+        bytes(range(255)),
+    ]
+    for data in checksum_inputs:
+        padded = data + b"\x00" * (len(data) % 2)
+        expected = sum(struct.unpack(f"!{len(padded) // 2}H", padded))
+        while expected >> 16:
+            expected = (expected & 0xFFFF) + (expected >> 16)
+        actual = _ones_complement_sum(data)
+        status = "PASS" if actual == expected else "FAIL"
+        print(f"{status}: sum of {len(data)} byte(s) is {actual:#06x} (expected {expected:#06x})")